@@ -0,0 +1,355 @@
+"""
+Signal Filters - Per-sensor conditioning pipeline (outlier rejection, smoothing, calibration)
+"""
+import bisect
+import math
+import logging
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# Scale factor that makes the MAD a consistent estimator of the standard deviation
+MAD_SCALE = 1.4826
+
+# Returned by a stage that is still warming up: no output yet, but not a rejection
+HOLD = object()
+
+
+def _kth_of_two(a, len_a, b, len_b, k):
+    """Return the k-th smallest (0-based) element of two sorted sequences given as accessors"""
+    lo, hi = max(0, k + 1 - len_b), min(k + 1, len_a)
+    while lo < hi:
+        i = (lo + hi) // 2
+        if a(i) < b(k - i):
+            lo = i + 1
+        else:
+            hi = i
+    i, j = lo, k + 1 - lo
+    if i == 0:
+        return b(j - 1)
+    if j == 0:
+        return a(i - 1)
+    return max(a(i - 1), b(j - 1))
+
+
+class SlidingWindow:
+    """Fixed-size window kept in arrival order and in sorted order.
+
+    push() locates positions with O(log w) comparisons (the list insert/delete
+    still shifts up to w references); median() is O(1) and mad() is O(log w).
+    Values must be finite, since NaN breaks the sorted order.
+    """
+
+    def __init__(self, size):
+        if size < 1:
+            raise ValueError(f"Window size must be >= 1, got {size}")
+        self.size = size
+        self.samples = deque()
+        self.sorted = []
+
+    def __len__(self):
+        return len(self.samples)
+
+    def push(self, value):
+        """Add a sample, evicting the oldest one when the window is full"""
+        if len(self.samples) == self.size:
+            oldest = self.samples.popleft()
+            del self.sorted[bisect.bisect_left(self.sorted, oldest)]
+        self.samples.append(value)
+        bisect.insort(self.sorted, value)
+
+    def median(self):
+        """Median of the window"""
+        s = self.sorted
+        n = len(s)
+        mid = n // 2
+        if n % 2:
+            return s[mid]
+        return (s[mid - 1] + s[mid]) / 2
+
+    def mad(self, median=None):
+        """Median absolute deviation, found by binary search over the sorted window"""
+        s = self.sorted
+        n = len(s)
+        if median is None:
+            median = self.median()
+
+        # Deviations below and above the median are two ascending sequences
+        split = bisect.bisect_right(s, median)
+
+        def below(i):
+            return median - s[split - 1 - i]
+
+        def above(i):
+            return s[split + i] - median
+
+        len_below, len_above = split, n - split
+        mid = n // 2
+        upper = _kth_of_two(below, len_below, above, len_above, mid)
+        if n % 2:
+            return upper
+        lower = _kth_of_two(below, len_below, above, len_above, mid - 1)
+        return (lower + upper) / 2
+
+
+class SignalFilter:
+    """Base class for a filter stage.
+
+    process() returns the (possibly transformed) value, None to reject the sample,
+    or HOLD while the stage does not have enough history to decide.
+    """
+
+    name = 'filter'
+
+    def process(self, value, timestamp):
+        return value
+
+
+class RangeFilter(SignalFilter):
+    """Reject values outside a physically plausible range"""
+
+    name = 'range'
+
+    def __init__(self, min=None, max=None):
+        if min is not None and max is not None and min > max:
+            raise ValueError(f"Range min ({min}) is greater than max ({max})")
+        self.min = min
+        self.max = max
+
+    def process(self, value, timestamp):
+        if self.min is not None and value < self.min:
+            return None
+        if self.max is not None and value > self.max:
+            return None
+        return value
+
+
+class HampelFilter(SignalFilter):
+    """Reject samples that deviate from the window median by more than n_sigmas * scaled MAD.
+
+    min_deviation is the smallest deviation ever treated as an outlier. It is required
+    because a flat signal has a MAD of 0; set it to a few steps of the sensor resolution.
+    Output is held back until the window has `warmup` samples.
+    """
+
+    name = 'hampel'
+
+    def __init__(self, min_deviation, window=7, n_sigmas=3.0, replace=False, warmup=3):
+        if min_deviation <= 0:
+            raise ValueError(f"Hampel min_deviation must be > 0, got {min_deviation}")
+        if n_sigmas <= 0:
+            raise ValueError(f"Hampel n_sigmas must be > 0, got {n_sigmas}")
+        if not 1 <= warmup <= window:
+            raise ValueError(f"Hampel warmup must be between 1 and window ({window}), got {warmup}")
+        self.window = SlidingWindow(window)
+        self.n_sigmas = n_sigmas
+        self.min_deviation = min_deviation
+        self.replace = replace
+        self.warmup = warmup
+
+    def process(self, value, timestamp):
+        # Raw samples always enter the window so a genuine step change is followed
+        self.window.push(value)
+        if len(self.window) < self.warmup:
+            return HOLD
+
+        median = self.window.median()
+        threshold = max(self.n_sigmas * MAD_SCALE * self.window.mad(median), self.min_deviation)
+        if abs(value - median) > threshold:
+            return median if self.replace else None
+        return value
+
+
+class MedianFilter(SignalFilter):
+    """Rolling median smoothing"""
+
+    name = 'median'
+
+    def __init__(self, window=5):
+        self.window = SlidingWindow(window)
+
+    def process(self, value, timestamp):
+        self.window.push(value)
+        return self.window.median()
+
+
+class EMAFilter(SignalFilter):
+    """Exponential moving average smoothing"""
+
+    name = 'ema'
+
+    def __init__(self, alpha=0.3):
+        if not 0 < alpha <= 1:
+            raise ValueError(f"EMA alpha must be in (0, 1], got {alpha}")
+        self.alpha = alpha
+        self.value = None
+
+    def process(self, value, timestamp):
+        if self.value is None:
+            self.value = value
+        else:
+            self.value += self.alpha * (value - self.value)
+        return self.value
+
+
+class RateLimitFilter(SignalFilter):
+    """Limit the rate of change (units per second) relative to the last accepted value.
+
+    The first sample is only a candidate reference: output is held back until a
+    following sample is within the rate limit of it, so a glitch at startup
+    cannot become the reference.
+    """
+
+    name = 'rate_limit'
+
+    def __init__(self, max_rate, action='reject'):
+        if max_rate <= 0:
+            raise ValueError(f"rate_limit max_rate must be > 0, got {max_rate}")
+        if action not in ('reject', 'clamp'):
+            raise ValueError(f"Unknown rate_limit action: {action}")
+        self.max_rate = max_rate
+        self.action = action
+        self.last_value = None
+        self.last_time = None
+        self.confirmed = False
+
+    def _within_limit(self, value, timestamp):
+        return abs(value - self.last_value) <= self.max_rate * (timestamp - self.last_time)
+
+    def process(self, value, timestamp):
+        if self.last_value is None:
+            self.last_value = value
+            self.last_time = timestamp
+            return HOLD
+
+        if not self.confirmed:
+            if self._within_limit(value, timestamp):
+                self.confirmed = True
+            self.last_value = value
+            self.last_time = timestamp
+            return value if self.confirmed else HOLD
+
+        if not self._within_limit(value, timestamp):
+            if self.action == 'reject':
+                # Keep the last accepted time so the allowed delta grows until the signal is followed
+                return None
+            max_delta = self.max_rate * (timestamp - self.last_time)
+            value = self.last_value + (max_delta if value > self.last_value else -max_delta)
+        self.last_value = value
+        self.last_time = timestamp
+        return value
+
+
+class LinearCalibration(SignalFilter):
+    """Linear calibration: value * scale + offset"""
+
+    name = 'linear'
+
+    def __init__(self, scale=1.0, offset=0.0):
+        self.scale = scale
+        self.offset = offset
+
+    def process(self, value, timestamp):
+        return value * self.scale + self.offset
+
+
+class PolynomialCalibration(SignalFilter):
+    """Polynomial calibration, coefficients in ascending order (c0 + c1*x + c2*x^2 ...)"""
+
+    name = 'polynomial'
+
+    def __init__(self, coefficients):
+        if not coefficients:
+            raise ValueError("Polynomial calibration needs at least one coefficient")
+        self.coefficients = list(coefficients)
+
+    def process(self, value, timestamp):
+        result = 0.0
+        for coefficient in reversed(self.coefficients):
+            result = result * value + coefficient
+        return result
+
+
+FILTER_TYPES = {
+    cls.name: cls
+    for cls in (
+        RangeFilter,
+        HampelFilter,
+        MedianFilter,
+        EMAFilter,
+        RateLimitFilter,
+        LinearCalibration,
+        PolynomialCalibration,
+    )
+}
+
+
+def create_filter(filter_cfg):
+    """Create a filter stage from its config entry"""
+    params = dict(filter_cfg)
+    filter_type = params.pop('type', None)
+    if filter_type not in FILTER_TYPES:
+        raise ValueError(f"Unknown filter type: {filter_type}")
+    try:
+        return FILTER_TYPES[filter_type](**params)
+    except TypeError as e:
+        raise ValueError(f"Invalid parameters for {filter_type} filter: {e}")
+
+
+class FilterPipeline:
+    """Runs a sample through a chain of filter stages and keeps counters"""
+
+    def __init__(self, filters_config, precision=None):
+        self.stages = [create_filter(cfg) for cfg in filters_config]
+        self.precision = precision
+        self.accepted = 0
+        self.rejected = 0
+        self.held = 0
+        self.consecutive_rejected = 0
+        # Keyed by position so repeated stage types are counted separately
+        self.stage_keys = [f"{i}:{stage.name}" for i, stage in enumerate(self.stages)]
+        self.rejected_by = {'non_finite': 0}
+        self.rejected_by.update({key: 0 for key in self.stage_keys})
+        self.last_raw = None
+        self.last_value = None
+
+    def _reject(self, key):
+        self.rejected += 1
+        self.consecutive_rejected += 1
+        self.rejected_by[key] += 1
+        return None
+
+    def process(self, value, timestamp):
+        """Return the conditioned value, None if a stage rejected the sample,
+        or HOLD if a stage is still warming up
+        """
+        self.last_raw = value
+        # NaN/inf would poison every windowed or stateful stage downstream
+        if not math.isfinite(value):
+            return self._reject('non_finite')
+
+        for key, stage in zip(self.stage_keys, self.stages):
+            value = stage.process(value, timestamp)
+            if value is None:
+                return self._reject(key)
+            if value is HOLD:
+                self.held += 1
+                return HOLD
+
+        if self.precision is not None:
+            value = round(value, self.precision)
+        self.accepted += 1
+        self.consecutive_rejected = 0
+        self.last_value = value
+        return value
+
+    def stats(self):
+        """Counters and last values for diagnostics"""
+        return {
+            'accepted': self.accepted,
+            'rejected': self.rejected,
+            'held': self.held,
+            'rejected_by': dict(self.rejected_by),
+            'last_raw': self.last_raw,
+            'last_value': self.last_value
+        }
@@ -36,6 +36,7 @@ class Gateway:
     
     def __init__(self, config_path='config/config.json'):
         self.running = False
+        self.last_filter_counts = {}
         self.config = self._load_config(config_path)
         self.mac_address = self._get_mac_address()
         
@@ -111,8 +112,11 @@ class Gateway:
         interval = self.config.get('sensors', {}).get('reading_interval', 30)
         logger.info(f"📊 Sensor reading interval: {interval} seconds")
         
+        stats_interval = self.config.get('sensors', {}).get('filter_stats_interval', 600)
+        
         # Main loop
         last_reading_time = 0
+        last_stats_time = time.time()
         
         while self.running:
             try:
@@ -123,6 +127,11 @@ class Gateway:
                     self._read_and_publish_sensors()
                     last_reading_time = current_time
                 
+                # Periodically summarize sensor filter counters
+                if current_time - last_stats_time >= stats_interval:
+                    self._log_filter_stats()
+                    last_stats_time = current_time
+                
                 # Small sleep to prevent CPU hogging
                 time.sleep(1)
                 
@@ -153,6 +162,21 @@ class Gateway:
         except Exception as e:
             logger.error(f"Error reading/publishing sensors: {e}")
     
+    def _log_filter_stats(self):
+        """Log filter counters for sensors whose counts changed since the last summary"""
+        for name, stats in self.sensor_manager.get_filter_stats().items():
+            counts = (stats['accepted'], stats['rejected'], stats['held'])
+            if counts == self.last_filter_counts.get(name):
+                continue
+            self.last_filter_counts[name] = counts
+            
+            rejected_by = {k: v for k, v in stats['rejected_by'].items() if v}
+            logger.info(
+                f"🧮 {name}: accepted {stats['accepted']}, rejected {stats['rejected']} "
+                f"{rejected_by}, held {stats['held']}, "
+                f"last {stats['last_raw']} -> {stats['last_value']}"
+            )
+    
     def stop(self):
         """Stop the gateway"""
         self.running = False
@@ -161,6 +185,8 @@ class Gateway:
         """Cleanup resources"""
         logger.info("🧹 Cleaning up...")
         
+        self._log_filter_stats()
+        
         try:
             self.mqtt_client.disconnect()
             self.actuator_manager.cleanup()
@@ -7,6 +7,8 @@ import logging
 import random
 import platform
 
+from filters import FilterPipeline, HOLD
+
 logger = logging.getLogger(__name__)
 
 # Check if running on Raspberry Pi
@@ -27,6 +29,7 @@ class SensorManager:
     def __init__(self, config):
         self.config = config
         self.sensors = {}
+        self.filters = {}
         self.reading_interval = config.get('reading_interval', 30)
         self._setup_sensors()
     
@@ -43,6 +46,15 @@ class SensorManager:
             pin = sensor_cfg.get('pin')
             
             try:
+                # Build the filter pipeline first so a bad config skips the sensor
+                filters_config = sensor_cfg.get('filters')
+                pipeline = None
+                if filters_config:
+                    pipeline = FilterPipeline(
+                        filters_config,
+                        precision=sensor_cfg.get('precision')
+                    )
+                
                 if IS_RASPBERRY_PI:
                     if sensor_type in ['TEMPERATURE', 'HUMIDITY']:
                         # DHT22 sensor
@@ -69,6 +81,11 @@ class SensorManager:
                         'simulated': True
                     }
                 
+                if pipeline and sensor_name in self.sensors:
+                    self.filters[sensor_name] = pipeline
+                    logger.info(f"Filters for {sensor_name}: "
+                                f"{[f['type'] for f in filters_config]}")
+                
                 logger.info(f"Initialized sensor: {sensor_name} ({sensor_type})")
                 
             except Exception as e:
@@ -81,6 +98,8 @@ class SensorManager:
         for name, sensor in self.sensors.items():
             try:
                 value = self._read_sensor(sensor)
+                if value is not None and name in self.filters:
+                    value = self._apply_filters(name, value)
                 if value is not None:
                     readings[sensor['type'].lower()] = value
                     logger.debug(f"{name}: {value}{sensor.get('unit', '')}")
@@ -89,6 +108,31 @@ class SensorManager:
         
         return readings
     
+    def _apply_filters(self, name, raw_value):
+        """Run a raw reading through the sensor's filter pipeline"""
+        pipeline = self.filters[name]
+        streak = pipeline.consecutive_rejected
+        value = pipeline.process(raw_value, time.monotonic())
+        
+        if value is HOLD:
+            logger.debug(f"{name}: filters warming up, holding {raw_value}")
+            return None
+        
+        if value is None:
+            # Only warn on the first rejection of a streak to keep the log readable
+            log = logger.warning if streak == 0 else logger.debug
+            log(f"Rejected reading from {name}: {raw_value} "
+                f"(rejected so far: {pipeline.rejected})")
+        else:
+            if streak > 1:
+                logger.info(f"{name} readings accepted again after {streak} rejections")
+            logger.debug(f"{name}: raw {raw_value} -> filtered {value}")
+        return value
+    
+    def get_filter_stats(self):
+        """Get filter counters and last values per sensor"""
+        return {name: pipeline.stats() for name, pipeline in self.filters.items()}
+    
     def _read_sensor(self, sensor):
         """Read a single sensor"""
         sensor_type = sensor['type']
@@ -0,0 +1,169 @@
+"""
+Tests for the sensor signal filters
+"""
+import os
+import sys
+import random
+import statistics
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from filters import (
+    HOLD,
+    FilterPipeline,
+    HampelFilter,
+    PolynomialCalibration,
+    RateLimitFilter,
+    SlidingWindow,
+    create_filter,
+)
+
+
+class SlidingWindowTest(unittest.TestCase):
+
+    def test_median_and_mad_match_reference(self):
+        rng = random.Random(42)
+        for _ in range(500):
+            window = SlidingWindow(rng.randint(1, 9))
+            for _ in range(20):
+                window.push(rng.choice([rng.randint(0, 3), round(rng.uniform(-10, 10), 1)]))
+                samples = list(window.samples)
+                median = statistics.median(samples)
+                mad = statistics.median([abs(x - median) for x in samples])
+                self.assertAlmostEqual(window.median(), median)
+                self.assertAlmostEqual(window.mad(), mad)
+
+    def test_evicts_oldest(self):
+        window = SlidingWindow(3)
+        for value in [1, 2, 3, 100]:
+            window.push(value)
+        self.assertEqual(list(window.samples), [2, 3, 100])
+
+
+class HampelFilterTest(unittest.TestCase):
+
+    def test_rejects_spike(self):
+        hampel = HampelFilter(min_deviation=0.5, window=5)
+        outputs = [hampel.process(v, i) for i, v in enumerate([20.0, 20.1, 20.0, 99.9, 20.1])]
+        self.assertEqual(outputs, [HOLD, HOLD, 20.0, None, 20.1])
+
+    def test_holds_output_during_warmup(self):
+        hampel = HampelFilter(min_deviation=0.5, warmup=3)
+        outputs = [hampel.process(v, i) for i, v in enumerate([0.0, 22.0, 22.0, 22.0])]
+        self.assertEqual(outputs, [HOLD, HOLD, 22.0, 22.0])
+
+    def test_accepts_resolution_steps_on_flat_signal(self):
+        hampel = HampelFilter(min_deviation=0.3)
+        values = [20.0] * 7 + [20.1, 20.0, 20.2, 20.1]
+        outputs = [hampel.process(v, i) for i, v in enumerate(values)]
+        self.assertEqual(outputs[2:], values[2:])
+
+    def test_replace_with_median(self):
+        hampel = HampelFilter(min_deviation=0.5, window=5, replace=True)
+        for i, value in enumerate([20.0, 20.0, 20.0]):
+            hampel.process(value, i)
+        self.assertEqual(hampel.process(99.9, 3), 20.0)
+
+
+class RateLimitFilterTest(unittest.TestCase):
+
+    def test_holds_until_reference_confirmed(self):
+        limiter = RateLimitFilter(max_rate=0.1)
+        outputs = [limiter.process(v, t) for t, v in [(0, 0.0), (30, 22.0), (60, 22.0), (90, 22.5)]]
+        self.assertEqual(outputs, [HOLD, HOLD, 22.0, 22.5])
+
+    def test_reject(self):
+        limiter = RateLimitFilter(max_rate=0.1)
+        limiter.process(20.0, 0)
+        limiter.process(20.0, 10)
+        self.assertIsNone(limiter.process(30.0, 20))
+        # Allowed delta grows from the last accepted time
+        self.assertEqual(limiter.process(22.0, 30), 22.0)
+
+    def test_clamp(self):
+        limiter = RateLimitFilter(max_rate=0.1, action='clamp')
+        limiter.process(20.0, 0)
+        limiter.process(20.0, 10)
+        self.assertAlmostEqual(limiter.process(30.0, 20), 21.0)
+        self.assertAlmostEqual(limiter.process(0.0, 30), 20.0)
+
+
+class CalibrationTest(unittest.TestCase):
+
+    def test_polynomial(self):
+        polynomial = PolynomialCalibration([1, 2, 3])
+        self.assertEqual(polynomial.process(2, 0), 17)
+        self.assertEqual(polynomial.process(0, 0), 1)
+
+    def test_linear(self):
+        linear = create_filter({'type': 'linear', 'scale': 2, 'offset': -1})
+        self.assertEqual(linear.process(3, 0), 5)
+
+
+class CreateFilterTest(unittest.TestCase):
+
+    def test_unknown_type(self):
+        with self.assertRaises(ValueError):
+            create_filter({'type': 'kalman'})
+
+    def test_bad_parameters(self):
+        bad_configs = [
+            {'type': 'hampel'},
+            {'type': 'hampel', 'min_deviation': 0},
+            {'type': 'rate_limit', 'max_rate': 0},
+            {'type': 'rate_limit', 'max_rate': 1, 'action': 'ignore'},
+            {'type': 'range', 'min': 10, 'max': 0},
+            {'type': 'ema', 'alpha': 0},
+            {'type': 'median', 'window': 0},
+            {'type': 'polynomial', 'coefficients': []},
+            {'type': 'linear', 'gain': 2},
+        ]
+        for cfg in bad_configs:
+            with self.subTest(cfg=cfg), self.assertRaises(ValueError):
+                create_filter(cfg)
+
+
+class FilterPipelineTest(unittest.TestCase):
+
+    def test_counts_repeated_stage_types_separately(self):
+        pipeline = FilterPipeline([
+            {'type': 'range', 'min': 0},
+            {'type': 'linear', 'offset': -10},
+            {'type': 'range', 'min': 0},
+        ])
+        self.assertIsNone(pipeline.process(-1, 0))
+        self.assertIsNone(pipeline.process(5, 1))
+        self.assertEqual(pipeline.process(15, 2), 5)
+        stats = pipeline.stats()
+        self.assertEqual(stats['rejected_by']['0:range'], 1)
+        self.assertEqual(stats['rejected_by']['2:range'], 1)
+        self.assertEqual((stats['accepted'], stats['rejected']), (1, 2))
+
+    def test_rejects_non_finite(self):
+        pipeline = FilterPipeline([{'type': 'median', 'window': 3}])
+        self.assertIsNone(pipeline.process(float('nan'), 0))
+        self.assertIsNone(pipeline.process(float('inf'), 1))
+        self.assertEqual(pipeline.process(20.0, 2), 20.0)
+        self.assertEqual(pipeline.stats()['rejected_by']['non_finite'], 2)
+
+    def test_boot_glitch_is_not_published(self):
+        pipeline = FilterPipeline([
+            {'type': 'range', 'min': -40, 'max': 80},
+            {'type': 'hampel', 'window': 7, 'n_sigmas': 3, 'min_deviation': 0.5},
+            {'type': 'rate_limit', 'max_rate': 0.1},
+            {'type': 'ema', 'alpha': 0.5},
+        ], precision=1)
+        values = [0.0] + [22.0] * 20
+        outputs = [pipeline.process(v, i * 30) for i, v in enumerate(values)]
+        published = [v for v in outputs if v is not None and v is not HOLD]
+        self.assertEqual(published, [22.0] * len(published))
+        self.assertEqual(outputs.index(22.0), 3)
+        # Warmup holds are not counted as rejections
+        stats = pipeline.stats()
+        self.assertEqual((stats['rejected'], stats['held']), (0, 3))
+        self.assertEqual(pipeline.consecutive_rejected, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()